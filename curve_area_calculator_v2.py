@@ -1,48 +1,283 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from typing import List, Tuple
-import random
+from matplotlib.collections import LineCollection
+from typing import List, Optional, Tuple, Union
+import functools
+import multiprocessing
 import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from numba import boolean, float64, njit, prange, vectorize
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Above this many point-edge pairs points_in_polygon switches to the Numba
+# kernel, which needs no (n_points, n_edges) temporaries
+NUMBA_PIP_THRESHOLD = 2_000_000
+
+# The NumPy path works through the query points in chunks of about this many
+# point-edge pairs, so its temporaries stay cache-sized
+PIP_CHUNK_PAIRS = 131072
+
+
+if HAS_NUMBA:
+    # Compiled lazily on first use, so importing the module does not start
+    # Numba's thread pool; cache=True then loads the kernel from __pycache__
+    # on later runs. Without a pinned signature, read-only inputs simply get
+    # their own specialization.
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _pip_numba(xs, ys, xi, yi, xj, yj):
+        """
+        Compiled winding number test, parallelized over the query points.
+        Arrays are only ever indexed with scalars.
+        """
+        n_points = xs.shape[0]
+        n_edges = xi.shape[0]
+        inside = np.zeros(n_points, dtype=np.bool_)
+
+        for p in prange(n_points):
+            x = xs[p]
+            y = ys[p]
+            wn = 0
+            for k in range(n_edges):
+                cross = (xj[k] - xi[k]) * (y - yi[k]) - (x - xi[k]) * (yj[k] - yi[k])
+                if yi[k] <= y:
+                    if yj[k] > y and cross > 0:
+                        wn += 1
+                elif yj[k] <= y and cross < 0:
+                    wn -= 1
+            inside[p] = wn != 0
+
+        return inside
+
+    def make_pip_ufunc(poly):
+        """
+        Build a parallel NumPy ufunc pip(x, y) -> bool for one polygon, with
+        the usual broadcasting over scalar and array arguments. The vertex
+        arrays are frozen into the compiled kernel, so every call to this
+        factory compiles a new ufunc.
+        """
+        pts = np.ascontiguousarray(poly, dtype=np.float64)
+        px = pts[:, 0].copy()
+        py = pts[:, 1].copy()
+        # A plain int64 scalar keeps `% n` well-typed inside the kernel
+        n = np.int64(len(pts))
+
+        @vectorize([boolean(float64, float64)], target='parallel')
+        def pip(x, y):
+            wn = 0
+            for i in range(n):
+                j = (i + 1) % n
+                cross = (px[j] - px[i]) * (y - py[i]) - (x - px[i]) * (py[j] - py[i])
+                if py[i] <= y:
+                    if py[j] > y and cross > 0:
+                        wn += 1
+                elif py[j] <= y and cross < 0:
+                    wn -= 1
+            return wn != 0
+
+        return pip
+
+
+@functools.lru_cache(maxsize=None)
+def _sample_grid(samples_per_side: int) -> np.ndarray:
+    """
+    Regular (S, 2) grid of sample positions at the centres of the sub-cells of
+    a unit cell. Cached and returned read-only, so callers must copy to modify.
+    """
+    ii, jj = np.mgrid[0:samples_per_side, 0:samples_per_side]
+    sample_coords = ((np.stack([ii, jj], axis=-1) + 0.5) / samples_per_side).reshape(-1, 2)
+    sample_coords.setflags(write=False)
+    return sample_coords
+
 
 class CurveAreaCalculator:
-    def __init__(self, coordinates: List[Tuple[float, float]]):
+    def __init__(self, coordinates: List[Tuple[float, float]], seed: Optional[int] = None,
+                 single_precision: bool = False):
         """
         Initialize with a list of (x, y) coordinates defining a piecewise linear curve.
         The curve is automatically closed (last point connects to first).
+        An optional seed makes the random sampling methods reproducible.
+
+        single_precision=True runs the NumPy point-in-polygon test in float32,
+        halving the memory traffic of its temporaries. Coordinates are taken
+        relative to the bounding box corner first, but points within roughly
+        1e-7 * bbox size of an edge may still be misclassified. It is ignored
+        (float64 is used) when any coordinate exceeds 1e6 in magnitude.
         """
-        self.coordinates = coordinates
-        self.n_points = len(coordinates)
+        self.single_precision = single_precision
+
+        # Vertices as a C-contiguous (n, 2) array, plus stride-1 x and y rows
+        self._pts = np.ascontiguousarray(coordinates, dtype=np.float64)
+        self._x, self._y = np.ascontiguousarray(self._pts.T)
+        self.n_points = len(self._pts)
         
         # Get bounding box
-        x_coords = [p[0] for p in coordinates]
-        y_coords = [p[1] for p in coordinates]
-        
-        self.min_x = min(x_coords)
-        self.max_x = max(x_coords)
-        self.min_y = min(y_coords)
-        self.max_y = max(y_coords)
-        
-        self.bbox_width = self.max_x - self.min_x
-        self.bbox_height = self.max_y - self.min_y
+        (self.min_x, self.min_y), (self.max_x, self.max_y) = self._pts.min(axis=0), self._pts.max(axis=0)
+        self.bbox_width, self.bbox_height = np.ptp(self._pts, axis=0)
         self.bbox_area = self.bbox_width * self.bbox_height
-    
-    def point_in_polygon_ray_casting(self, x: float, y: float) -> bool:
+
+        # Edge arrays (edge k runs from vertex k to vertex k+1, wrapping around)
+        self._xi = self._x
+        self._yi = self._y
+        self._xj = np.roll(self._xi, -1)
+        self._yj = np.roll(self._yi, -1)
+
+        # Per-edge vectors for the point-in-polygon test
+        self._dx = self._xj - self._xi
+        self._dy = self._yj - self._yi
+
+        # The same edge data in the precision used by _pip_winding, relative to
+        # the bounding box corner when running in float32
+        if single_precision and np.abs(self._pts).max() <= 1e6:
+            self._pip_dtype = np.float32
+            self._pip_origin = (self.min_x, self.min_y)
+        else:
+            self._pip_dtype = np.float64
+            self._pip_origin = (0.0, 0.0)
+        ox, oy = self._pip_origin
+        self._pip_edges = tuple(a.astype(self._pip_dtype, copy=False) for a in
+                                (self._xi - ox, self._yi - oy, self._yj - oy, self._dx, self._dy))
+
+        # Convex polygons turn the same way at every vertex and go around
+        # exactly once (a pentagram turns one way too, but twice around)
+        turn = self._dx * np.roll(self._dy, -1) - self._dy * np.roll(self._dx, -1)
+        turn_dot = self._dx * np.roll(self._dx, -1) + self._dy * np.roll(self._dy, -1)
+        total_turn = np.arctan2(turn, turn_dot).sum()
+        self._convex = bool(self.n_points >= 3 and
+                            (np.all(turn >= 0) or np.all(turn <= 0)) and
+                            np.isclose(abs(total_turn), 2 * np.pi))
+        if self._convex:
+            # Edge vectors flipped for clockwise polygons, so that inside is
+            # always to the left of every edge
+            orientation = np.sign(total_turn).astype(self._pip_dtype)
+            self._convex_edges = (self._pip_edges[3] * orientation, self._pip_edges[4] * orientation)
+
+        # Lazily computed, see exact_area, _is_simple and point_in_polygon_ray_casting
+        self._exact_area = None
+        self._simple = None
+        self._pip_ufunc = None
+
+        # Workers of the parallel Monte Carlo method get child streams spawned
+        # from the same seed sequence
+        self._seed_seq = np.random.SeedSequence(seed)
+        self._rng = np.random.default_rng(self._seed_seq)
+
+    @property
+    def coordinates(self) -> List[Tuple[float, float]]:
         """
-        Determine if point (x, y) is inside the polygon using ray casting algorithm.
-        Casts a ray from the point to the right and counts intersections.
+        The polygon vertices as a list of (x, y) tuples.
         """
-        inside = False
-        j = self.n_points - 1
-        
-        for i in range(self.n_points):
-            xi, yi = self.coordinates[i]
-            xj, yj = self.coordinates[j]
-            
-            if ((yi > y) != (yj > y)) and (x < (xj - xi) * (y - yi) / (yj - yi) + xi):
-                inside = not inside
-            j = i
-            
+        return [tuple(p) for p in self._pts.tolist()]
+
+    def point_in_polygon_ray_casting(self, x: Union[float, np.ndarray],
+                                     y: Union[float, np.ndarray]) -> Union[bool, np.ndarray]:
+        """
+        Determine if point (x, y) is inside the polygon.
+        Kept under its original name; the test itself is now the winding
+        number rule of points_in_polygon.
+
+        x and y may also be arrays of any broadcastable shape, in which case a
+        boolean array of the broadcast shape is returned. With Numba installed,
+        batches above NUMBA_PIP_THRESHOLD point-edge pairs go through a
+        per-polygon ufunc from make_pip_ufunc, compiled on first use. The
+        ufunc is float64 only, so single_precision instances never use it.
+        """
+        if np.ndim(x) == 0 and np.ndim(y) == 0:
+            return bool(self.points_in_polygon(np.atleast_1d(x), np.atleast_1d(y))[0])
+
+        n_points = np.prod(np.broadcast_shapes(np.shape(x), np.shape(y)))
+        if (HAS_NUMBA and self._pip_dtype == np.float64 and
+                n_points * len(self._xi) > NUMBA_PIP_THRESHOLD):
+            if self._pip_ufunc is None:
+                self._pip_ufunc = make_pip_ufunc(self._pts)
+            # The compiled loop can raise the invalid flag on finite input
+            # without affecting the result
+            with np.errstate(invalid='ignore'):
+                return self._pip_ufunc(x, y)
+
+        x, y = np.broadcast_arrays(x, y)
+        return self.points_in_polygon(x.ravel(), y.ravel()).reshape(x.shape)
+
+    def points_in_polygon(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """
+        Batched winding number test for many points at once.
+
+        Small batches are broadcast against all edges with NumPy, a chunk of
+        points at a time, using a cheaper half-plane test when the polygon is
+        convex; large ones use the compiled Numba kernel when Numba is
+        installed.
+
+        Args:
+            xs, ys: 1-D arrays of query point coordinates
+
+        Returns:
+            Boolean array, True where the point is inside the polygon
+        """
+        xs = np.ascontiguousarray(xs, dtype=np.float64)
+        ys = np.ascontiguousarray(ys, dtype=np.float64)
+
+        if HAS_NUMBA and len(xs) * len(self._xi) > NUMBA_PIP_THRESHOLD:
+            return _pip_numba(xs, ys, self._xi, self._yi, self._xj, self._yj)
+
+        pip = self._pip_convex if self._convex else self._pip_winding
+
+        chunk = max(1, PIP_CHUNK_PAIRS // len(self._xi))
+        if len(xs) <= chunk:
+            return pip(xs, ys)
+
+        inside = np.empty(len(xs), dtype=bool)
+        for start in range(0, len(xs), chunk):
+            stop = start + chunk
+            inside[start:stop] = pip(xs[start:stop], ys[start:stop])
+        return inside
+
+    def _pip_convex(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """
+        Half-plane test for convex polygons: a point is inside when it is
+        strictly on the inner side of every edge. Points lying on an edge are
+        left to _pip_winding, so boundary points get the same half-open
+        answer on every path.
+        """
+        xi, yi = self._pip_edges[:2]
+        dx, dy = self._convex_edges
+        ox, oy = self._pip_origin
+        x = (xs - ox).astype(self._pip_dtype, copy=False)[:, None]
+        y = (ys - oy).astype(self._pip_dtype, copy=False)[:, None]
+
+        cross = dx * (y - yi) - (x - xi) * dy
+        inside = (cross > 0).all(axis=1)
+
+        on_boundary = (cross >= 0).all(axis=1) & ~inside
+        if on_boundary.any():
+            inside[on_boundary] = self._pip_winding(xs[on_boundary], ys[on_boundary])
         return inside
+
+    def _pip_winding(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """
+        Winding number test broadcast over all (point, edge) pairs.
+
+        Upward edges with the point strictly to their left add one, downward
+        edges with the point strictly to their right subtract one; a non-zero
+        total means inside. Unlike ray casting this needs no division, and
+        self-overlapping regions count as inside.
+        """
+        xi, yi, yj, dx, dy = self._pip_edges
+        ox, oy = self._pip_origin
+        x = (xs - ox).astype(self._pip_dtype, copy=False)[:, None]
+        y = (ys - oy).astype(self._pip_dtype, copy=False)[:, None]
+
+        # Which side of each edge the point lies on (> 0 is left)
+        cross = dx * (y - yi) - (x - xi) * dy
+
+        upward = (yi <= y) & (yj > y) & (cross > 0)
+        downward = (yi > y) & (yj <= y) & (cross < 0)
+
+        # int8 sums wrap around, but wn only has to be right modulo 256
+        wn = upward.sum(axis=1, dtype=np.int8) - downward.sum(axis=1, dtype=np.int8)
+        return wn != 0
     
     def grid_method(self, grid_resolution: int = 100, samples_per_cell: int = 16) -> dict:
         """
@@ -60,41 +295,15 @@ class CurveAreaCalculator:
         cell_width = self.bbox_width / grid_resolution
         cell_height = self.bbox_height / grid_resolution
         cell_area = cell_width * cell_height
-        
-        total_area = 0.0
-        cells_processed = 0
-        
+
         # Create sample points within a unit cell (0,0) to (1,1)
         samples_per_side = int(np.sqrt(samples_per_cell))
-        sample_coords = []
-        for i in range(samples_per_side):
-            for j in range(samples_per_side):
-                # Add small random offset to avoid systematic bias
-                offset_x = random.uniform(-0.1, 0.1) / samples_per_side
-                offset_y = random.uniform(-0.1, 0.1) / samples_per_side
-                sample_x = (i + 0.5) / samples_per_side + offset_x
-                sample_y = (j + 0.5) / samples_per_side + offset_y
-                sample_coords.append((sample_x, sample_y))
-        
-        for i in range(grid_resolution):
-            for j in range(grid_resolution):
-                # Cell boundaries
-                cell_left = self.min_x + i * cell_width
-                cell_bottom = self.min_y + j * cell_height
-                
-                # Sample points within this cell
-                inside_count = 0
-                for sx, sy in sample_coords:
-                    test_x = cell_left + sx * cell_width
-                    test_y = cell_bottom + sy * cell_height
-                    
-                    if self.point_in_polygon_ray_casting(test_x, test_y):
-                        inside_count += 1
-                
-                # Estimate fraction of cell that's inside the curve
-                cell_fraction = inside_count / len(sample_coords)
-                total_area += cell_fraction * cell_area
-                cells_processed += 1
+        sample_coords = self._unit_cell_samples(samples_per_side)
+
+        # Estimate fraction of each cell that's inside the curve
+        coverage = self._cell_coverage(grid_resolution, sample_coords)
+        total_area = float(coverage.sum() * cell_area)
+        cells_processed = coverage.size
         
         computation_time = time.time() - start_time
         
@@ -107,28 +316,153 @@ class CurveAreaCalculator:
             'computation_time': computation_time
         }
     
-    def monte_carlo_method(self, n_samples: int = 100000) -> dict:
+    def _unit_cell_samples(self, samples_per_side: int, jitter: bool = True) -> np.ndarray:
+        """
+        (S, 2) sample positions within a unit cell (0,0) to (1,1), optionally
+        jittered by up to 10% of the sub-cell size.
+        """
+        sample_coords = _sample_grid(samples_per_side)
+        if jitter:
+            # Add small random offset to avoid systematic bias
+            offsets = self._rng.uniform(-0.1, 0.1, sample_coords.shape) / samples_per_side
+            sample_coords = sample_coords + offsets
+        return sample_coords
+
+    def _edge_cells(self, grid_resolution: int) -> np.ndarray:
+        """
+        Mark the grid cells that at least one polygon edge passes through.
+
+        Returns:
+            (grid_resolution, grid_resolution) bool array indexed [i, j]
+        """
+        cell_width = self.bbox_width / grid_resolution
+        cell_height = self.bbox_height / grid_resolution
+
+        # Inclusive range of grid columns overlapped by each edge
+        last = grid_resolution - 1
+        lo_x = np.minimum(self._xi, self._xj)
+        hi_x = np.maximum(self._xi, self._xj)
+        i0 = np.clip(np.ceil((lo_x - self.min_x) / cell_width) - 1, 0, last).astype(np.int64)
+        i1 = np.clip(np.floor((hi_x - self.min_x) / cell_width), 0, last).astype(np.int64)
+
+        # Expand to one (edge, column) pair per column in each range
+        n_cols = i1 - i0 + 1
+        edge = np.repeat(np.arange(len(n_cols)), n_cols)
+        ci = i0[edge] + np.arange(n_cols.sum()) - np.repeat(np.cumsum(n_cols) - n_cols, n_cols)
+
+        # y-range of the part of the edge inside each column's x-slab;
+        # vertical edges span their whole y-range
+        slab_lo = np.maximum(lo_x[edge], self.min_x + ci * cell_width)
+        slab_hi = np.minimum(hi_x[edge], self.min_x + (ci + 1) * cell_width)
+        dx = self._dx[edge]
+        vertical = dx == 0
+        slope = self._dy[edge] / np.where(vertical, 1.0, dx)
+        ya = np.where(vertical, self._yi[edge], self._yi[edge] + slope * (slab_lo - self._xi[edge]))
+        yb = np.where(vertical, self._yj[edge], self._yi[edge] + slope * (slab_hi - self._xi[edge]))
+        j0 = np.clip(np.ceil((np.minimum(ya, yb) - self.min_y) / cell_height) - 1, 0, last).astype(np.int64)
+        j1 = np.clip(np.floor((np.maximum(ya, yb) - self.min_y) / cell_height), 0, last).astype(np.int64)
+
+        # Expand each column's run of rows into the cells it crosses
+        n_rows = j1 - j0 + 1
+        run = np.repeat(np.arange(len(n_rows)), n_rows)
+        cj = j0[run] + np.arange(n_rows.sum()) - np.repeat(np.cumsum(n_rows) - n_rows, n_rows)
+
+        cells = np.zeros((grid_resolution, grid_resolution), dtype=bool)
+        cells[ci[run], cj] = True
+        return cells
+
+    def _cell_coverage(self, grid_resolution: int, sample_coords: np.ndarray) -> np.ndarray:
+        """
+        Fraction of each grid cell's sample points that fall inside the polygon.
+
+        Cells that no edge passes through are uniformly inside or outside, so
+        they are classified from their corners; only the boundary cells are
+        sub-sampled.
+
+        Args:
+            grid_resolution: Number of grid cells along each axis
+            sample_coords: (S, 2) array of sample positions within a unit cell
+
+        Returns:
+            (grid_resolution, grid_resolution) array indexed [i, j] = [x cell, y cell]
+        """
+        # A flat bounding box encloses nothing, and its zero-size cells
+        # cannot be indexed
+        if self.bbox_width == 0 or self.bbox_height == 0:
+            return np.zeros((grid_resolution, grid_resolution))
+
+        cell_width = self.bbox_width / grid_resolution
+        cell_height = self.bbox_height / grid_resolution
+
+        # Test the (G+1, G+1) grid corners once
+        corner_x = self.min_x + np.arange(grid_resolution + 1) * cell_width
+        corner_y = self.min_y + np.arange(grid_resolution + 1) * cell_height
+        cx, cy = np.meshgrid(corner_x, corner_y, indexing='ij')
+        corners = self.points_in_polygon(cx.ravel(), cy.ravel()).reshape(cx.shape)
+
+        inside_corners = (corners[:-1, :-1].astype(np.int8) + corners[1:, :-1] +
+                          corners[:-1, 1:] + corners[1:, 1:])
+        mixed = (inside_corners > 0) & (inside_corners < 4)
+        boundary = mixed | self._edge_cells(grid_resolution)
+
+        coverage = (inside_corners == 4).astype(np.float64)
+
+        # Broadcast boundary cell corners (B, 1) against samples (1, S)
+        bi, bj = np.nonzero(boundary)
+        test_x = corner_x[bi][:, None] + sample_coords[:, 0][None, :] * cell_width
+        test_y = corner_y[bj][:, None] + sample_coords[:, 1][None, :] * cell_height
+
+        inside = self.points_in_polygon(test_x.ravel(), test_y.ravel())
+        coverage[boundary] = inside.reshape(test_x.shape).mean(axis=1)
+        return coverage
+
+    def _count_inside(self, n_samples: int, rng: np.random.Generator) -> int:
+        """
+        Throw n_samples random points into the bounding box and count the hits.
+        """
+        xs = rng.uniform(self.min_x, self.max_x, n_samples)
+        ys = rng.uniform(self.min_y, self.max_y, n_samples)
+        return int(self.points_in_polygon(xs, ys).sum())
+
+    def monte_carlo_method(self, n_samples: int = 100000, n_workers: Optional[int] = None) -> dict:
         """
         Approximate area using Monte Carlo simulation.
+
+        This is an educational reference for demonstrating statistical
+        convergence; for simple polygons analytical_area() is exact and O(N).
         
         Args:
             n_samples: Number of random sample points to generate
+            n_workers: If set, split the samples across this many worker
+                processes, each drawing from its own independent random stream.
+                Workers are started with 'spawn', so scripts calling this need
+                an `if __name__ == "__main__":` guard
             
         Returns:
             dict with area estimate and method details
         """
+        if n_workers is not None and n_workers < 1:
+            raise ValueError(f"n_workers must be at least 1, got {n_workers}")
+
         start_time = time.time()
         
-        inside_count = 0
-        
-        for _ in range(n_samples):
-            # Generate random point in bounding box
-            x = random.uniform(self.min_x, self.max_x)
-            y = random.uniform(self.min_y, self.max_y)
-            
-            if self.point_in_polygon_ray_casting(x, y):
-                inside_count += 1
-        
+        if n_workers is None:
+            inside_count = self._count_inside(n_samples, self._rng)
+        else:
+            # Spread the remainder so the chunks add up to exactly n_samples
+            chunk_sizes = [n_samples // n_workers + (k < n_samples % n_workers)
+                           for k in range(n_workers)]
+            seeds = self._seed_seq.spawn(n_workers)
+
+            # Forking a process that has already started Numba's thread pool
+            # leaves the interpreter hanging at exit, so spawn fresh workers
+            with ProcessPoolExecutor(max_workers=n_workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                inside_counts = executor.map(_mc_chunk, [self._pts] * n_workers,
+                                             [self.single_precision] * n_workers,
+                                             chunk_sizes, seeds)
+                inside_count = sum(inside_counts)
+
         # Area = (fraction inside) * (bounding box area)
         fraction_inside = inside_count / n_samples
         estimated_area = fraction_inside * self.bbox_area
@@ -142,6 +476,7 @@ class CurveAreaCalculator:
             'inside_count': inside_count,
             'fraction_inside': fraction_inside,
             'bounding_box_area': self.bbox_area,
+            'n_workers': n_workers or 1,
             'computation_time': computation_time
         }
     
@@ -149,19 +484,76 @@ class CurveAreaCalculator:
         """
         Calculate exact area using the Shoelace formula (for comparison).
         """
-        area = 0.0
-        j = self.n_points - 1
-        
-        for i in range(self.n_points):
-            area += (self.coordinates[j][0] + self.coordinates[i][0]) * (self.coordinates[j][1] - self.coordinates[i][1])
-            j = i
-        
-        return abs(area) / 2.0
+        return float(0.5 * abs(self._x @ np.roll(self._y, -1) - self._y @ np.roll(self._x, -1)))
+
+    @property
+    def exact_area(self) -> float:
+        """
+        Shoelace area, computed once and cached on the instance.
+        """
+        if self._exact_area is None:
+            self._exact_area = self.analytical_area()
+        return self._exact_area
+
+    def _is_simple(self) -> bool:
+        """
+        Check that no two non-adjacent edges intersect or touch, i.e. that the
+        Shoelace area is the true enclosed area. The result is cached.
+        """
+        if self._simple is not None:
+            return self._simple
+
+        def orient(ax, ay, bx, by, cx, cy):
+            return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+        def on_segment(d, px, py, ax, ay, bx, by):
+            return ((d == 0) &
+                    (np.minimum(ax, bx) <= px) & (px <= np.maximum(ax, bx)) &
+                    (np.minimum(ay, by) <= py) & (py <= np.maximum(ay, by)))
+
+        n_edges = len(self._xi)
+        bxi, byi = self._xi[None, :], self._yi[None, :]
+        bxj, byj = self._xj[None, :], self._yj[None, :]
+
+        # Test a block of edges (rows) against every edge (columns) at a time,
+        # sized like the point-in-polygon chunks so the (rows, E) temporaries
+        # stay small, and stop at the first block with an intersection
+        block = max(1, PIP_CHUNK_PAIRS // n_edges)
+        intersects = False
+        for start in range(0, n_edges, block):
+            rows = np.arange(start, min(start + block, n_edges))
+            axi, ayi = self._xi[rows, None], self._yi[rows, None]
+            axj, ayj = self._xj[rows, None], self._yj[rows, None]
+
+            d1 = orient(axi, ayi, axj, ayj, bxi, byi)
+            d2 = orient(axi, ayi, axj, ayj, bxj, byj)
+            d3 = orient(bxi, byi, bxj, byj, axi, ayi)
+            d4 = orient(bxi, byi, bxj, byj, axj, ayj)
+
+            crossing = ((d1 * d2) < 0) & ((d3 * d4) < 0)
+            touching = (on_segment(d1, bxi, byi, axi, ayi, axj, ayj) |
+                        on_segment(d2, bxj, byj, axi, ayi, axj, ayj) |
+                        on_segment(d3, axi, ayi, bxi, byi, bxj, byj) |
+                        on_segment(d4, axj, ayj, bxi, byi, bxj, byj))
+
+            # Neighbouring edges always share a vertex, so leave them out
+            offset = (np.arange(n_edges)[None, :] - rows[:, None]) % n_edges
+            non_adjacent = (offset != 0) & (offset != 1) & (offset != n_edges - 1)
+
+            if np.any((crossing | touching) & non_adjacent):
+                intersects = True
+                break
+
+        self._simple = bool(n_edges >= 3 and not intersects)
+        return self._simple
     
     def compare_methods(self, grid_resolution: int = 100, samples_per_cell: int = 16, 
-                       monte_carlo_samples: int = 100000) -> None:
+                       monte_carlo_samples: int = 100000, prefer_exact: bool = False) -> None:
         """
         Compare both methods and print results.
+
+        With prefer_exact=True the sampling methods are skipped for simple
+        (non-self-intersecting) polygons, where the Shoelace area is exact.
         """
         print(f"Curve with {self.n_points} vertices")
         print(f"Bounding box: [{self.min_x:.2f}, {self.max_x:.2f}] × [{self.min_y:.2f}, {self.max_y:.2f}]")
@@ -169,9 +561,14 @@ class CurveAreaCalculator:
         print("-" * 60)
         
         # Analytical solution
-        true_area = self.analytical_area()
+        true_area = self.exact_area
         print(f"Analytical area (Shoelace formula): {true_area:.6f}")
         print("-" * 60)
+
+        if prefer_exact and self._is_simple():
+            print("Polygon is simple, so the Shoelace area is exact; skipping sampling methods.")
+            print("-" * 60)
+            return
         
         # Grid method
         grid_result = self.grid_method(grid_resolution, samples_per_cell)
@@ -199,38 +596,45 @@ class CurveAreaCalculator:
         print(f"  Computation time: {mc_result['computation_time']:.4f} seconds")
         print("-" * 60)
     
-    def plot_curve(self, show_grid: bool = False, grid_resolution: int = 50):
+    def plot_curve(self, show_grid: bool = False, grid_resolution: int = 50,
+                   ax: Optional[plt.Axes] = None):
         """
         Visualize the curve and optionally overlay a grid.
+        Draws into ax if given, otherwise into a new figure that is shown.
         """
-        fig, ax = plt.subplots(1, 1, figsize=(10, 8))
+        own_figure = ax is None
+        if own_figure:
+            fig, ax = plt.subplots(1, 1, figsize=(10, 8))
         
         # Plot the curve
-        x_coords = [p[0] for p in self.coordinates] + [self.coordinates[0][0]]
-        y_coords = [p[1] for p in self.coordinates] + [self.coordinates[0][1]]
+        x_coords = np.append(self._x, self._x[0])
+        y_coords = np.append(self._y, self._y[0])
         
         ax.plot(x_coords, y_coords, 'b-', linewidth=2, label='Piecewise Linear Curve')
         ax.fill(x_coords, y_coords, alpha=0.3, color='lightblue', label='Enclosed Area')
-        ax.scatter([p[0] for p in self.coordinates], [p[1] for p in self.coordinates], 
-                  color='red', s=50, zorder=5, label='Vertices')
+        ax.scatter(self._x, self._y, color='red', s=50, zorder=5, label='Vertices')
         
-        # Optionally show grid
+        x_lim = (self.min_x - 0.1 * self.bbox_width, self.max_x + 0.1 * self.bbox_width)
+        y_lim = (self.min_y - 0.1 * self.bbox_height, self.max_y + 0.1 * self.bbox_height)
+        
+        # Optionally show grid, as one collection spanning the visible area
         if show_grid:
-            cell_width = self.bbox_width / grid_resolution
-            cell_height = self.bbox_height / grid_resolution
+            xs = np.linspace(self.min_x, self.max_x, grid_resolution + 1)
+            ys = np.linspace(self.min_y, self.max_y, grid_resolution + 1)
             
-            # Vertical lines
-            for i in range(grid_resolution + 1):
-                x = self.min_x + i * cell_width
-                ax.axvline(x, color='gray', alpha=0.3, linewidth=0.5)
+            # (N, 2, 2) segments: vertical lines first, then horizontal ones
+            vertical = np.empty((len(xs), 2, 2))
+            vertical[:, :, 0] = xs[:, None]
+            vertical[:, :, 1] = y_lim
+            horizontal = np.empty((len(ys), 2, 2))
+            horizontal[:, :, 0] = x_lim
+            horizontal[:, :, 1] = ys[:, None]
             
-            # Horizontal lines
-            for j in range(grid_resolution + 1):
-                y = self.min_y + j * cell_height
-                ax.axhline(y, color='gray', alpha=0.3, linewidth=0.5)
+            ax.add_collection(LineCollection(np.concatenate([vertical, horizontal]),
+                                             colors='gray', alpha=0.3, linewidths=0.5))
         
-        ax.set_xlim(self.min_x - 0.1 * self.bbox_width, self.max_x + 0.1 * self.bbox_width)
-        ax.set_ylim(self.min_y - 0.1 * self.bbox_height, self.max_y + 0.1 * self.bbox_height)
+        ax.set_xlim(*x_lim)
+        ax.set_ylim(*y_lim)
         ax.set_xlabel('X')
         ax.set_ylabel('Y')
         ax.set_title('Piecewise Linear Curve Area Approximation')
@@ -238,68 +642,46 @@ class CurveAreaCalculator:
         ax.grid(True, alpha=0.3)
         ax.set_aspect('equal')
         
-        plt.tight_layout()
-        plt.show()
+        if own_figure:
+            plt.tight_layout()
+            plt.show()
     
-    def plot_grid_method(self, grid_resolution: int = 50, samples_per_cell: int = 16):
+    def plot_grid_method(self, grid_resolution: int = 50, samples_per_cell: int = 16,
+                         ax: Optional[plt.Axes] = None):
         """
         Visualize the grid method showing colored squares based on their contribution.
+        Draws into ax if given, otherwise into a new figure that is shown.
         """
-        fig, ax = plt.subplots(1, 1, figsize=(12, 10))
-        
-        cell_width = self.bbox_width / grid_resolution
-        cell_height = self.bbox_height / grid_resolution
+        own_figure = ax is None
+        if own_figure:
+            fig, ax = plt.subplots(1, 1, figsize=(12, 10))
         
         # Create sample points within a unit cell
         samples_per_side = int(np.sqrt(samples_per_cell))
-        sample_coords = []
-        for i in range(samples_per_side):
-            for j in range(samples_per_side):
-                sample_x = (i + 0.5) / samples_per_side
-                sample_y = (j + 0.5) / samples_per_side
-                sample_coords.append((sample_x, sample_y))
-        
-        # Color each cell based on coverage
-        for i in range(grid_resolution):
-            for j in range(grid_resolution):
-                cell_left = self.min_x + i * cell_width
-                cell_bottom = self.min_y + j * cell_height
-                cell_right = cell_left + cell_width
-                cell_top = cell_bottom + cell_height
-                
-                # Test sample points within this cell
-                inside_count = 0
-                for sx, sy in sample_coords:
-                    test_x = cell_left + sx * cell_width
-                    test_y = cell_bottom + sy * cell_height
-                    
-                    if self.point_in_polygon_ray_casting(test_x, test_y):
-                        inside_count += 1
-                
-                # Calculate coverage fraction
-                coverage = inside_count / len(sample_coords)
-                
-                # Color the cell based on coverage
-                if coverage > 0:
-                    # Color from light green (partial) to dark green (full coverage)
-                    color = plt.cm.Greens(0.3 + 0.7 * coverage)
-                    rect = plt.Rectangle((cell_left, cell_bottom), cell_width, cell_height,
-                                       facecolor=color, edgecolor='black', linewidth=0.1, alpha=0.8)
-                    ax.add_patch(rect)
+        sample_coords = self._unit_cell_samples(samples_per_side, jitter=False)
+
+        cell_coverage = self._cell_coverage(grid_resolution, sample_coords)
+
+        # Color each cell based on coverage, from light green (partial) to dark
+        # green (full coverage); cells with no coverage are left blank
+        xedges = np.linspace(self.min_x, self.max_x, grid_resolution + 1)
+        yedges = np.linspace(self.min_y, self.max_y, grid_resolution + 1)
+        shade = np.ma.masked_equal(cell_coverage, 0) * 0.7 + 0.3
+        ax.pcolormesh(xedges, yedges, shade.T, cmap='Greens', vmin=0, vmax=1, shading='flat', alpha=0.8)
         
         # Plot the original curve on top
-        x_coords = [p[0] for p in self.coordinates] + [self.coordinates[0][0]]
-        y_coords = [p[1] for p in self.coordinates] + [self.coordinates[0][1]]
+        x_coords = np.append(self._x, self._x[0])
+        y_coords = np.append(self._y, self._y[0])
         
-        ax.plot(x_coords, y_coords, 'red', linewidth=3, label='Polygon Boundary', zorder=10)
-        ax.scatter([p[0] for p in self.coordinates], [p[1] for p in self.coordinates], 
-                  color='darkred', s=60, zorder=11, label='Vertices', edgecolor='white')
+        boundary_line, = ax.plot(x_coords, y_coords, 'red', linewidth=3, label='Polygon Boundary', zorder=10)
+        vertices = ax.scatter(self._x, self._y, color='darkred', s=60, zorder=11,
+                              label='Vertices', edgecolor='white')
         
         # Create custom legend for grid colors
         from matplotlib.patches import Patch
         legend_elements = [
-            ax.lines[0],  # Polygon boundary
-            ax.collections[0] if ax.collections else Patch(color='darkred', label='Vertices'),  # Vertices
+            boundary_line,
+            vertices,
             Patch(facecolor=plt.cm.Greens(0.4), label='Partial Coverage'),
             Patch(facecolor=plt.cm.Greens(1.0), label='Full Coverage')
         ]
@@ -312,48 +694,45 @@ class CurveAreaCalculator:
         ax.legend(handles=legend_elements)
         ax.set_aspect('equal')
         
-        plt.tight_layout()
-        plt.show()
+        if own_figure:
+            plt.tight_layout()
+            plt.show()
     
-    def plot_monte_carlo_method(self, n_samples: int = 5000, point_size: float = 1.0):
+    def plot_monte_carlo_method(self, n_samples: int = 5000, point_size: float = 1.0,
+                                ax: Optional[plt.Axes] = None):
         """
         Visualize Monte Carlo method showing 'darts thrown' - points inside vs outside.
+        Draws into ax if given, otherwise into a new figure that is shown.
         """
-        fig, ax = plt.subplots(1, 1, figsize=(12, 10))
+        own_figure = ax is None
+        if own_figure:
+            fig, ax = plt.subplots(1, 1, figsize=(12, 10))
         
         # Generate random points and classify them
-        inside_points = []
-        outside_points = []
-        
-        for _ in range(n_samples):
-            x = random.uniform(self.min_x, self.max_x)
-            y = random.uniform(self.min_y, self.max_y)
-            
-            if self.point_in_polygon_ray_casting(x, y):
-                inside_points.append((x, y))
-            else:
-                outside_points.append((x, y))
+        xs = self._rng.uniform(self.min_x, self.max_x, n_samples)
+        ys = self._rng.uniform(self.min_y, self.max_y, n_samples)
+        inside_mask = self.points_in_polygon(xs, ys)
+        n_inside = int(inside_mask.sum())
+        n_outside = n_samples - n_inside
         
         # Plot the outside points first (so inside points are on top)
-        if outside_points:
-            outside_x, outside_y = zip(*outside_points)
-            ax.scatter(outside_x, outside_y, c='red', s=point_size, alpha=0.6, 
-                      label=f'Outside ({len(outside_points)} points)')
+        if n_outside:
+            ax.scatter(xs[~inside_mask], ys[~inside_mask], c='red', s=point_size, alpha=0.6, 
+                      label=f'Outside ({n_outside} points)')
         
         # Plot the inside points
-        if inside_points:
-            inside_x, inside_y = zip(*inside_points)
-            ax.scatter(inside_x, inside_y, c='green', s=point_size, alpha=0.7, 
-                      label=f'Inside ({len(inside_points)} points)')
+        if n_inside:
+            ax.scatter(xs[inside_mask], ys[inside_mask], c='green', s=point_size, alpha=0.7, 
+                      label=f'Inside ({n_inside} points)')
         
         # Plot the polygon boundary
-        x_coords = [p[0] for p in self.coordinates] + [self.coordinates[0][0]]
-        y_coords = [p[1] for p in self.coordinates] + [self.coordinates[0][1]]
+        x_coords = np.append(self._x, self._x[0])
+        y_coords = np.append(self._y, self._y[0])
         
         ax.fill(x_coords, y_coords, alpha=0.2, color='lightblue', zorder=5)
         ax.plot(x_coords, y_coords, 'blue', linewidth=3, label='Polygon Boundary', zorder=10)
-        ax.scatter([p[0] for p in self.coordinates], [p[1] for p in self.coordinates], 
-                  color='darkblue', s=80, zorder=11, label='Vertices', edgecolor='white')
+        ax.scatter(self._x, self._y, color='darkblue', s=80, zorder=11,
+                   label='Vertices', edgecolor='white')
         
         # Draw bounding box
         bbox_rect = plt.Rectangle((self.min_x, self.min_y), self.bbox_width, self.bbox_height,
@@ -362,7 +741,7 @@ class CurveAreaCalculator:
         ax.add_patch(bbox_rect)
         
         # Calculate and display statistics
-        fraction_inside = len(inside_points) / n_samples if n_samples > 0 else 0
+        fraction_inside = n_inside / n_samples if n_samples > 0 else 0
         estimated_area = fraction_inside * self.bbox_area
         
         ax.set_xlim(self.min_x - 0.05 * self.bbox_width, self.max_x + 0.05 * self.bbox_width)
@@ -374,24 +753,40 @@ class CurveAreaCalculator:
         ax.legend()
         ax.set_aspect('equal')
         
-        plt.tight_layout()
-        plt.show()
+        if own_figure:
+            plt.tight_layout()
+            plt.show()
     
     def visualize_all_methods(self, grid_resolution: int = 50, samples_per_cell: int = 16, 
                              mc_samples: int = 3000, mc_point_size: float = 2.0):
         """
-        Create all three visualizations in sequence.
+        Create all three visualizations side by side in one figure.
         """
         print("Generating visualizations...")
+        fig, axes = plt.subplots(1, 3, figsize=(24, 8), sharex=True, sharey=True)
         
         print("1. Basic polygon plot")
-        self.plot_curve()
+        self.plot_curve(ax=axes[0])
         
         print("2. Grid method visualization")
-        self.plot_grid_method(grid_resolution, samples_per_cell)
+        self.plot_grid_method(grid_resolution, samples_per_cell, ax=axes[1])
         
         print("3. Monte Carlo method visualization") 
-        self.plot_monte_carlo_method(mc_samples, mc_point_size)
+        self.plot_monte_carlo_method(mc_samples, mc_point_size, ax=axes[2])
+        
+        plt.tight_layout()
+        plt.show()
+
+
+def _mc_chunk(vertices: np.ndarray, single_precision: bool, n_samples: int,
+              seed: np.random.SeedSequence) -> int:
+    """
+    Worker for the parallel Monte Carlo method. Only the vertex array and the
+    precision setting are sent to the worker process; the calculator is
+    rebuilt there from them.
+    """
+    calc = CurveAreaCalculator(vertices, single_precision=single_precision)
+    return calc._count_inside(n_samples, np.random.default_rng(seed))
 
 
 # Example usage and test cases
@@ -447,6 +842,16 @@ if __name__ == "__main__":
     print("Testing star shape with different grid resolutions:")
     
     
+    print("\n" + "=" * 80)
+    print("PARALLEL MONTE CARLO")
+    print("=" * 80)
+    
+    # Split the samples across worker processes; they are spawned, so calls
+    # with n_workers belong under an `if __name__ == "__main__":` guard
+    mc_parallel = calc3.monte_carlo_method(150000, n_workers=2)
+    print(f"Star area with {mc_parallel['n_workers']} workers: {mc_parallel['area']:.6f} "
+          f"(analytical {calc3.exact_area:.6f})")
+    
     print("\n" + "=" * 80)
     print("VISUALIZATION EXAMPLES")
     print("=" * 80)